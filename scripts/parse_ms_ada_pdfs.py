@@ -6,13 +6,19 @@ This script extracts AD attribute information from the official Microsoft PDF do
 and outputs structured JSON data compatible with the enhanced schema format.
 """
 
-import re
-import json
 import argparse
+import hashlib
+import json
+import marshal
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import pymupdf  # PyMuPDF for PDF parsing
@@ -20,8 +26,94 @@ except ImportError:
     print("Error: PyMuPDF not installed. Run: uv add pymupdf", file=sys.stderr)
     sys.exit(1)
 
-
-@dataclass
+try:
+    import orjson  # Optional, much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Bump whenever parsing output changes so stale cache entries are ignored
+CACHE_VERSION = 2
+
+# Plain text extraction: whitespace must be preserved because field lines are
+# marked with \xa0, ligatures are expanded so names match as plain ASCII
+_TEXT_FLAGS = pymupdf.TEXT_PRESERVE_WHITESPACE | pymupdf.TEXT_MEDIABOX_CLIP
+
+# What reading a missing, unreadable or malformed PDF can raise: OS errors,
+# FileDataError (a RuntimeError), decode errors and MuPDF's own exceptions
+_PDF_READ_ERRORS = (OSError, RuntimeError, ValueError, pymupdf.mupdf.FzErrorBase)
+
+
+def _identity(value: str) -> str:
+    """Keep string values unchanged."""
+    return value
+
+
+def _to_bool(value: str):
+    """Convert TRUE/FALSE strings to booleans, keeping anything else as-is."""
+    if value == "TRUE":
+        return True
+    if value == "FALSE":
+        return False
+    return value
+
+
+def _to_int(value: str):
+    """Convert numeric strings to integers, keeping anything else as-is."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+# Enhanced schema field -> (ADAttribute field, type conversion), in sorted key
+# order so entries need no sorting when serialized.
+# ldapDisplayName is always emitted, the other fields only when they have a value
+_FIELD_MAP = (
+    ("attributeId", "attribute_id", _identity),
+    ("attributeSecurityGuid", "attribute_security_guid", _identity),
+    ("attributeSyntax", "attribute_syntax", _identity),
+    ("cn", "cn", _identity),
+    ("isMemberOfPartialAttributeSet", "is_member_of_partial_attribute_set", _to_bool),
+    ("isSingleValued", "is_single_valued", _to_bool),
+    ("ldapDisplayName", "ldap_display_name", _identity),
+    ("mapiID", "mapi_id", _to_int),
+    ("omSyntax", "om_syntax", _to_int),
+    ("rangeLower", "range_lower", _to_int),
+    ("rangeUpper", "range_upper", _to_int),
+    ("schemaFlagsEx", "schema_flags_ex", _identity),
+    ("searchFlags", "search_flags", _identity),
+    ("systemFlags", "system_flags", _identity),
+    ("systemOnly", "system_only", _to_bool),
+)
+
+# ADAttribute fields reported in the --stats field coverage
+_STATS_FIELDS = (
+    "cn",
+    "ldap_display_name",
+    "attribute_id",
+    "schema_id_guid",
+    "attribute_syntax",
+)
+
+# ADAttribute fields drawn from a small set of values (syntaxes, flags, booleans);
+# their values are interned so repeats share one string
+_LOW_CARD_FIELDS = frozenset(
+    {
+        "attribute_syntax",
+        "om_syntax",
+        "is_single_valued",
+        "system_only",
+        "search_flags",
+        "range_lower",
+        "range_upper",
+        "is_member_of_partial_attribute_set",
+        "system_flags",
+        "schema_flags_ex",
+    }
+)
+
+
+@dataclass(slots=True)
 class ADAttribute:
     """Active Directory attribute data extracted from PDF."""
 
@@ -48,178 +140,246 @@ class ADAttribute:
 class MSADAPDFParser:
     """Parser for Microsoft Active Directory Schema PDF documents."""
 
-    def __init__(self):
-        # Regex patterns for extracting attribute data
-        self.attribute_header_pattern = re.compile(
-            r"^(\d+\.\d+)\s+Attribute\s+(.+)$", re.MULTILINE
-        )
-        self.field_patterns = {
-            "cn": re.compile(r"^\xa0cn:\s*(.+)$", re.MULTILINE | re.IGNORECASE),
-            "ldap_display_name": re.compile(
-                r"^\xa0ldapDisplayName:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "attribute_id": re.compile(
-                r"^\xa0attributeId:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "attribute_syntax": re.compile(
-                r"^\xa0attributeSyntax:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "om_syntax": re.compile(
-                r"^\xa0omSyntax:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "schema_id_guid": re.compile(
-                r"^\xa0schemaIdGuid:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "is_single_valued": re.compile(
-                r"^\xa0isSingleValued:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "system_only": re.compile(
-                r"^\xa0systemOnly:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "search_flags": re.compile(
-                r"^\xa0searchFlags:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "range_lower": re.compile(
-                r"^\xa0rangeLower:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "range_upper": re.compile(
-                r"^\xa0rangeUpper:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "attribute_security_guid": re.compile(
-                r"^\xa0attributeSecurityGuid:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "mapi_id": re.compile(
-                r"^\xa0mapiID:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "is_member_of_partial_attribute_set": re.compile(
-                r"^\xa0isMemberOfPartialAttributeSet:\s*(.+)$",
-                re.MULTILINE | re.IGNORECASE,
-            ),
-            "system_flags": re.compile(
-                r"^\xa0systemFlags:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
-            "schema_flags_ex": re.compile(
-                r"^\xa0schemaFlagsEx:\s*(.+)$", re.MULTILINE | re.IGNORECASE
-            ),
+    def __init__(self, cache_dir: Optional[Path] = None):
+        # Directory for per-PDF parse results, None disables caching
+        self.cache_dir = cache_dir
+
+        # PDF field name -> ADAttribute field; field lines look like "\xa0name: value"
+        self.field_names = {
+            "cn": "cn",
+            "ldapDisplayName": "ldap_display_name",
+            "attributeId": "attribute_id",
+            "attributeSyntax": "attribute_syntax",
+            "omSyntax": "om_syntax",
+            "schemaIdGuid": "schema_id_guid",
+            "isSingleValued": "is_single_valued",
+            "systemOnly": "system_only",
+            "searchFlags": "search_flags",
+            "rangeLower": "range_lower",
+            "rangeUpper": "range_upper",
+            "attributeSecurityGuid": "attribute_security_guid",
+            "mapiID": "mapi_id",
+            "isMemberOfPartialAttributeSet": "is_member_of_partial_attribute_set",
+            "systemFlags": "system_flags",
+            "schemaFlagsEx": "schema_flags_ex",
         }
 
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract all text content from PDF."""
-        try:
-            doc = pymupdf.open(pdf_path)
-            text_content = []
-
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text_content.append(page.get_text())
-
-            doc.close()
-            return "\n".join(text_content)
-
-        except Exception as e:
-            print(f"Error reading PDF {pdf_path}: {e}", file=sys.stderr)
-            return ""
+        # Regex patterns for extracting attribute data. A single token pattern
+        # matches both attribute headers and field lines, so the text is lexed once.
+        self.token_pattern = re.compile(
+            r"^(?P<section>\d+\.\d+)\s+Attribute\s+(?P<name>.+)$"
+            rf"|^\xa0(?P<field>{'|'.join(self.field_names)}):[ \t]*(?P<value>.+)$",
+            re.MULTILINE,
+        )
+        # Flag fields ending in "|" continue on lines indented with a double \xa0
+        self.continuation_pattern = re.compile(r"(?:\n\xa0\xa0[^\n]*\S[^\n]*)+")
+        self._ws_re = re.compile(r"\s+")
+
+    def extract_text_from_pdf(self, pdf_path: Path) -> Iterator[str]:
+        """Yield the text content of each PDF page in order."""
+        # Read the file in one sequential pass instead of many small reads
+        with pymupdf.open(stream=pdf_path.read_bytes(), filetype="pdf") as doc:
+            # PyMuPDF is not thread-safe, so pages are extracted serially here;
+            # parallelism comes from parsing each PDF in its own process.
+            for page in doc:
+                yield page.get_text("text", flags=_TEXT_FLAGS)
 
     def parse_attribute_blocks(self, text: str, source_pdf: str) -> List[ADAttribute]:
         """Parse attribute blocks from extracted PDF text."""
-        attributes = []
+        return self.parse_attribute_pages([text], source_pdf)
 
-        # Find all attribute headers
-        attribute_matches = list(self.attribute_header_pattern.finditer(text))
+    def parse_attribute_pages(
+        self, pages: Iterable[str], source_pdf: str
+    ) -> List[ADAttribute]:
+        """Parse attributes from page texts in a single lexer-style pass.
 
-        for i, match in enumerate(attribute_matches):
-            section_num = match.group(1)
-            attr_name = match.group(2).strip()
-
-            # Determine the text block for this attribute
-            start_pos = match.start()
-            if i + 1 < len(attribute_matches):
-                end_pos = attribute_matches[i + 1].start()
-                attr_block = text[start_pos:end_pos]
+        Headers start a new attribute and field lines fill in the current one, the
+        first occurrence of a field wins. Only the last non-blank line of a page is
+        carried into the next one, since a header or field may continue there.
+        """
+        attributes = []
+        attribute = None
+        attr_name = None
+        header_pos = 0
+        late_fields = []  # Fields beyond 2000 chars, dropped for the last attribute
+
+        buffer = None
+        offset = 0  # Document position of buffer[0]
+
+        # A trailing None marks the end of the document and flushes the buffer
+        for page_text in chain(pages, [None]):
+            if page_text is None:
+                if buffer is None:
+                    break
+                stop = len(buffer)
             else:
-                # Last attribute, take rest of text or reasonable chunk
-                attr_block = text[start_pos : start_pos + 2000]
-
-            # Extract field data from this block
-            attribute = ADAttribute(source_section=section_num, source_pdf=source_pdf)
-
-            # Extract each field using regex patterns
-            for field_name, pattern in self.field_patterns.items():
-                field_match = pattern.search(attr_block)
-                if field_match:
-                    value = field_match.group(1).strip()
-
-                    # Handle multiline fields (especially systemFlags, schemaFlagsEx)
-                    if field_name in [
-                        "system_flags",
-                        "schema_flags_ex",
-                    ] and value.endswith("|"):
-                        # Look for continuation lines
-                        lines = attr_block.split("\n")
-                        start_line_found = False
-                        multiline_value = value
-
-                        for line in lines:
-                            if field_match.group(0).strip() in line:
-                                start_line_found = True
-                                continue
-                            elif start_line_found:
-                                # Check if this is a continuation line (double \xa0)
-                                if line.startswith("\xa0\xa0") and (
-                                    "FLAG_" in line or line.strip()
-                                ):
-                                    continuation = line.replace("\xa0\xa0", "").strip()
-                                    if continuation:
-                                        multiline_value += " " + continuation
-                                else:
-                                    # End of multiline field
-                                    break
-
-                        value = multiline_value
-
-                    # Clean up common formatting issues
-                    value = re.sub(r"\s+", " ", value)  # Normalize whitespace
-                    value = value.strip()
-                    setattr(attribute, field_name, value)
-
-            # If we didn't find ldap_display_name, try to infer from attribute name
-            if not attribute.ldap_display_name and attr_name:
-                attribute.ldap_display_name = attr_name
-
-            attributes.append(attribute)
+                buffer = page_text if buffer is None else f"{buffer}\n{page_text}"
+                # Lex up to the start of the last non-blank line
+                stop = buffer.rfind("\n", 0, len(buffer.rstrip())) + 1
+
+            for match in self.token_pattern.finditer(buffer):
+                if match.start() >= stop:
+                    break
+
+                if match.group("section"):
+                    if attribute:
+                        self._apply_fields(attribute, late_fields)
+                        attributes.append(self._finish_attribute(attribute, attr_name))
+                    attribute = ADAttribute(
+                        source_section=match.group("section"), source_pdf=source_pdf
+                    )
+                    attr_name = match.group("name").strip()
+                    header_pos = offset + match.start()
+                    late_fields = []
+                    continue
+
+                if attribute is None:
+                    continue
+
+                field_name = self.field_names[match.group("field")]
+                value = match.group("value").strip()
+
+                # Handle multiline fields (especially systemFlags, schemaFlagsEx)
+                if field_name in [
+                    "system_flags",
+                    "schema_flags_ex",
+                ] and value.endswith("|"):
+                    continuation = self.continuation_pattern.match(buffer, match.end())
+                    if continuation:
+                        if page_text is not None and continuation.end() >= stop:
+                            # Continuation may go on past the page break
+                            stop = match.start()
+                            break
+                        value += continuation.group()
+
+                field = (field_name, value)
+                if offset + match.start() - header_pos < 2000:
+                    self._apply_fields(attribute, [field])
+                else:
+                    late_fields.append(field)
+
+            offset += stop
+            buffer = buffer[stop:]
+
+        if attribute:
+            # Last attribute, take rest of text or reasonable chunk
+            attributes.append(self._finish_attribute(attribute, attr_name))
 
         return attributes
 
+    def _apply_fields(
+        self, attribute: ADAttribute, fields: List[Tuple[str, str]]
+    ) -> None:
+        """Set raw field values that are not already present on the attribute."""
+        for field_name, value in fields:
+            if getattr(attribute, field_name) is None:
+                # Clean up common formatting issues
+                value = self._ws_re.sub(" ", value).strip()  # Normalize whitespace
+                if field_name in _LOW_CARD_FIELDS:
+                    value = sys.intern(value)
+                setattr(attribute, field_name, value)
+
+    def _finish_attribute(self, attribute: ADAttribute, attr_name: str) -> ADAttribute:
+        """Fill in fallbacks once all fields of an attribute have been seen."""
+        # If we didn't find ldap_display_name, try to infer from attribute name
+        if not attribute.ldap_display_name and attr_name:
+            attribute.ldap_display_name = attr_name
+        return attribute
+
     def parse_pdf_file(self, pdf_path: Path) -> List[ADAttribute]:
         """Parse a single PDF file and return extracted attributes."""
         print(f"Parsing PDF: {pdf_path.name}")
 
-        text = self.extract_text_from_pdf(pdf_path)
-        if not text:
+        cache_path = self.get_cache_path(pdf_path)
+        if cache_path:
+            attributes = self.load_cached_attributes(cache_path)
+            if attributes is not None:
+                print(f"  Found {len(attributes)} attributes (cached)")
+                return attributes
+
+        try:
+            pages = self.extract_text_from_pdf(pdf_path)
+            attributes = self.parse_attribute_pages(pages, pdf_path.name)
+        except _PDF_READ_ERRORS as e:
+            print(f"Error reading PDF {pdf_path}: {e}", file=sys.stderr)
             return []
 
-        attributes = self.parse_attribute_blocks(text, pdf_path.name)
         print(f"  Found {len(attributes)} attributes")
 
+        if cache_path:
+            self.save_cached_attributes(cache_path, attributes)
+
         return attributes
 
+    def get_cache_path(self, pdf_path: Path) -> Optional[Path]:
+        """Return the cache file for a PDF, keyed by its path, mtime and size."""
+        if self.cache_dir is None:
+            return None
+
+        stat = pdf_path.stat()
+        key = f"{CACHE_VERSION}:{pdf_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.marshal"
+
+    def load_cached_attributes(self, cache_path: Path) -> Optional[List[ADAttribute]]:
+        """Load previously parsed attributes, or None if no usable cache exists."""
+        try:
+            with open(cache_path, "rb") as f:
+                # marshal only restores plain data here, unlike pickle it runs no code
+                rows = marshal.load(f)
+            return [ADAttribute(*row) for row in rows]
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+            return None
+
+    def save_cached_attributes(
+        self, cache_path: Path, attributes: List[ADAttribute]
+    ) -> None:
+        """Store parsed attributes as plain field tuples for later runs."""
+        rows = [tuple(getattr(attr, k) for k in attr.__slots__) for attr in attributes]
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                marshal.dump(rows, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write cache {cache_path}: {e}", file=sys.stderr)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     def parse_multiple_pdfs(self, pdf_paths: List[Path]) -> Dict[str, ADAttribute]:
-        """Parse multiple PDF files and return consolidated attribute data."""
+        """Parse multiple PDF files and return consolidated attribute data.
+
+        PDFs are independent, so each one is parsed in its own worker process.
+        Results are merged in input order, later files override earlier ones.
+        """
         all_attributes = {}
 
+        existing_paths = []
         for pdf_path in pdf_paths:
             if not pdf_path.exists():
                 print(f"Warning: PDF file not found: {pdf_path}", file=sys.stderr)
                 continue
+            existing_paths.append(pdf_path)
 
-            attributes = self.parse_pdf_file(pdf_path)
+        if len(existing_paths) > 1:
+            max_workers = min(len(existing_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self.parse_pdf_file, existing_paths))
+        else:
+            results = [self.parse_pdf_file(pdf_path) for pdf_path in existing_paths]
 
+        for attributes in results:
             for attr in attributes:
                 # Use GUID as key if available, otherwise ldap_display_name
                 key = attr.schema_id_guid or attr.ldap_display_name
                 if key:
                     # Clean up GUID format if needed
-                    if key and len(key) == 36 and "-" in key:
+                    if len(key) == 36 and key[8] == "-":
                         key = key.lower()
                     all_attributes[key] = attr
 
@@ -233,60 +393,28 @@ class MSADAPDFParser:
 
         for guid, attr in attributes.items():
             enhanced_entry = {
-                "ldapDisplayName": attr.ldap_display_name,
+                enhanced_field: convert(value)
+                for enhanced_field, attr_field, convert in _FIELD_MAP
+                if (value := getattr(attr, attr_field))
+                or enhanced_field == "ldapDisplayName"
             }
-
-            # Field mapping from raw PDF data to enhanced schema format
-            field_mapping = {
-                "cn": attr.cn,
-                "attributeId": attr.attribute_id,
-                "attributeSyntax": attr.attribute_syntax,
-                "omSyntax": attr.om_syntax,
-                "isSingleValued": attr.is_single_valued,
-                "systemOnly": attr.system_only,
-                "searchFlags": attr.search_flags,
-                "rangeLower": attr.range_lower,
-                "rangeUpper": attr.range_upper,
-                "attributeSecurityGuid": attr.attribute_security_guid,
-                "mapiID": attr.mapi_id,
-                "isMemberOfPartialAttributeSet": attr.is_member_of_partial_attribute_set,
-                "systemFlags": attr.system_flags,
-                "schemaFlagsEx": attr.schema_flags_ex,
-            }
-
-            for enhanced_field, value in field_mapping.items():
-                if value is not None and value != "":
-                    # Convert TRUE/FALSE strings to boolean for specific fields
-                    if enhanced_field in [
-                        "isSingleValued",
-                        "systemOnly",
-                        "isMemberOfPartialAttributeSet",
-                    ]:
-                        if value == "TRUE":
-                            enhanced_entry[enhanced_field] = True
-                        elif value == "FALSE":
-                            enhanced_entry[enhanced_field] = False
-                        else:
-                            enhanced_entry[enhanced_field] = value
-                    # Convert numeric strings to integers for specific fields
-                    elif enhanced_field in [
-                        "omSyntax",
-                        "rangeLower",
-                        "rangeUpper",
-                        "mapiID",
-                    ]:
-                        try:
-                            enhanced_entry[enhanced_field] = int(value)
-                        except ValueError:
-                            enhanced_entry[enhanced_field] = value
-                    else:
-                        enhanced_entry[enhanced_field] = value
-
             enhanced_schema[guid] = enhanced_entry
 
-        # Save enhanced schema
-        with open(output_path, "w") as f:
-            json.dump(enhanced_schema, f, indent=2, sort_keys=True)
+        # Save enhanced schema; entries are already built in sorted key order,
+        # so only the top level needs sorting
+        sorted_schema = dict(sorted(enhanced_schema.items()))
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(sorted_schema, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which json handles
+                pass
+        if encoded is not None:
+            output_path.write_bytes(encoded)
+        else:
+            with open(output_path, "w") as f:
+                json.dump(sorted_schema, f, indent=2)
 
         # Print summary
         print("\n📊 Enhanced Schema Summary:")
@@ -324,16 +452,18 @@ class MSADAPDFParser:
         raw_data = {}
 
         for key, attr in attributes.items():
-            attr_dict = asdict(attr)
             # Remove None values and internal fields
             cleaned_dict = {
                 k: v
-                for k, v in attr_dict.items()
-                if v is not None and not k.startswith("source_")
+                for k in attr.__slots__
+                if (v := getattr(attr, k)) is not None and not k.startswith("source_")
             }
             raw_data[key] = cleaned_dict
 
-        json_output = json.dumps(raw_data, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            json_output = orjson.dumps(raw_data, option=orjson.OPT_INDENT_2).decode()
+        else:
+            json_output = json.dumps(raw_data, indent=2, ensure_ascii=False)
 
         if output_path:
             output_path.write_text(json_output, encoding="utf-8")
@@ -369,10 +499,22 @@ Examples:
 
     parser.add_argument("--stats", action="store_true", help="Show parsing statistics")
 
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore and do not write the parse cache"
+    )
+
     args = parser.parse_args()
 
-    # Initialize parser
-    pdf_parser = MSADAPDFParser()
+    # Initialize parser, caching per user alongside the CLI's own caches
+    cache_dir = None
+    if not args.no_cache:
+        src_dir = str(Path(__file__).resolve().parent.parent / "src")
+        if src_dir not in sys.path:
+            sys.path.append(src_dir)
+        from ad_schema_tool.cli import user_cache_dir
+
+        cache_dir = user_cache_dir() / "pdf"
+    pdf_parser = MSADAPDFParser(cache_dir=cache_dir)
 
     # Parse PDFs
     attributes = pdf_parser.parse_multiple_pdfs(args.pdf_files)
@@ -382,10 +524,7 @@ Examples:
         print(f"  Total attributes found: {len(attributes)}")
 
         # Count by source PDF
-        pdf_counts = {}
-        for attr in attributes.values():
-            pdf = attr.source_pdf or "unknown"
-            pdf_counts[pdf] = pdf_counts.get(pdf, 0) + 1
+        pdf_counts = Counter(attr.source_pdf or "unknown" for attr in attributes.values())
 
         for pdf, count in sorted(pdf_counts.items()):
             print(f"  {pdf}: {count} attributes")
@@ -393,13 +532,7 @@ Examples:
         # Count fields with data
         field_stats = {}
         for attr in attributes.values():
-            for field_name in [
-                "cn",
-                "ldap_display_name",
-                "attribute_id",
-                "schema_id_guid",
-                "attribute_syntax",
-            ]:
+            for field_name in _STATS_FIELDS:
                 value = getattr(attr, field_name)
                 if value:
                     field_stats[field_name] = field_stats.get(field_name, 0) + 1
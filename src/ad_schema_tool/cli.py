@@ -2,12 +2,19 @@
 """CLI interface for AD Schema Mapping Tool."""
 
 import argparse
-import csv
-import json
 import os
 import sys
+from bisect import bisect_left
+from functools import cached_property, lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NoReturn, Optional, Set, Tuple
+
+try:
+    import orjson  # Optional, much faster JSON parsing and serialization
+except ImportError:
+    orjson = None
 
 
 # ANSI Color codes for terminal output
@@ -35,9 +42,25 @@ class Colors:
     BG_BLUE = "\033[44m"
 
 
+# Combined styles used by the format helpers, concatenated once at import
+_HEADER_STYLE = Colors.BOLD + Colors.CYAN
+_NAME_STYLE = Colors.GREEN + Colors.BOLD
+_COUNT_STYLE = Colors.CYAN + Colors.BOLD
+
+
 # Global flag for plain output mode
 _PLAIN_OUTPUT = False
 
+# Buffer sizes for export/result files and streamed input files
+_WRITE_BUFFER_SIZE = 1 << 20
+_READ_BUFFER_SIZE = 1 << 20
+
+# Bump whenever load_schema_mappings output changes so stale caches are ignored
+MAPPINGS_CACHE_VERSION = 1
+
+# Schema file used when --schema-file isn't given
+DEFAULT_SCHEMA_FILE = Path("ad_schema_enhanced.json")
+
 
 def normalize_guid(guid: str) -> str:
     """Normalize GUID format by removing wrapping braces if present.
@@ -58,19 +81,95 @@ def normalize_guid(guid: str) -> str:
     return guid
 
 
+def _read_text(file_path: Path) -> str:
+    """Read a whole UTF-8 text file, translating newlines like text mode does.
+
+    Regular files are decoded straight from a read-only memory map, which skips
+    the intermediate bytes copy of read(). Pipes and other special files (e.g.
+    shell process substitution) can't be mapped and are read normally.
+    """
+    import mmap
+    import stat
+
+    with open(file_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            data = f.read().decode("utf-8")
+        elif st.st_size == 0:
+            data = ""
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    # The whole file is decoded front to back exactly once, so
+                    # start reading all of it ahead of the decoder
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                    mm.madvise(mmap.MADV_WILLNEED)
+                data = str(mm, "utf-8")
+
+    # Universal newlines, as open(..., "r") would have applied them
+    if "\r" in data:
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    return data
+
+
+def _read_guid_set(file_path: Path) -> Set[str]:
+    """Read the set of normalized GUIDs in a file, skipping empty lines and comments.
+
+    The file is read in one call and split in C rather than iterated line by line.
+    """
+    data = _read_text(file_path)
+    # Inlined normalize_guid, the lines are already stripped
+    return {
+        line[1:-1] if line[0] == "{" and line[-1] == "}" else line
+        for line in map(str.strip, data.split("\n"))
+        if line and line[0] != "#"
+    }
+
+
 class SchemaLookup:
     """Centralized schema lookup functionality."""
     
-    def __init__(self, mappings: Dict[str, str]):
-        self.guid_to_name = mappings
-        self._name_to_guid = None
+    def __init__(
+        self,
+        mappings: Optional[Dict[str, str]] = None,
+        schema_file: Optional[Path] = None,
+        use_cache: bool = True,
+    ):
+        # Without mappings, guid_to_name loads schema_file the first time it is used
+        if mappings is not None:
+            self.guid_to_name = mappings
+        self.schema_file = schema_file
+        self.use_cache = use_cache
+        self._name_lookups = 0
+
+    @cached_property
+    def guid_to_name(self) -> Dict[str, str]:
+        """Lazy-load the GUID to name mapping from schema_file."""
+        return load_schema_mappings(self.schema_file, self.use_cache)
     
-    @property
+    @cached_property
     def name_to_guid(self) -> Dict[str, str]:
-        """Lazy-build reverse mapping from name to GUID."""
-        if self._name_to_guid is None:
-            self._name_to_guid = {v: k for k, v in self.guid_to_name.items()}
-        return self._name_to_guid
+        """Lazy-build reverse mapping from name to GUID (built once per lookup)."""
+        # zip over the views builds the dict in C; later duplicates win as before
+        return dict(zip(self.guid_to_name.values(), self.guid_to_name.keys()))
+
+    @cached_property
+    def sorted_by_name(self) -> List[Tuple[str, str]]:
+        """(guid, name) pairs sorted by attribute name (sorted once per lookup)."""
+        return sorted(self.guid_to_name.items(), key=itemgetter(1))
+
+    @cached_property
+    def names_lower(self) -> List[str]:
+        """Lowercased names aligned with sorted_by_name, for substring searches."""
+        return [name.lower() for _, name in self.sorted_by_name]
+
+    @cached_property
+    def prefix_index(self) -> List[Tuple[str, str, str]]:
+        """(lowercased name, guid, name) triples sorted for prefix bisection."""
+        return sorted(
+            (name_lower, guid, name)
+            for (guid, name), name_lower in zip(self.sorted_by_name, self.names_lower)
+        )
     
     def lookup_by_guid(self, guid: str) -> Optional[str]:
         """Look up attribute name by GUID.
@@ -93,6 +192,15 @@ class SchemaLookup:
         Returns:
             GUID string (without braces) if found, None otherwise
         """
+        # A one-off lookup is cheaper as a linear scan than building the reverse
+        # index, so only build the index once lookups repeat. The scan runs
+        # backwards so duplicate names resolve to the same GUID as the index.
+        if self._name_lookups == 0 and "name_to_guid" not in self.__dict__:
+            self._name_lookups = 1
+            return next(
+                (guid for guid, n in reversed(self.guid_to_name.items()) if n == name),
+                None,
+            )
         return self.name_to_guid.get(name)
     
     def search_by_pattern(self, pattern: str) -> List[Tuple[str, str]]:
@@ -102,27 +210,42 @@ class SchemaLookup:
             pattern: Search pattern (case-insensitive)
             
         Returns:
-            List of (guid, name) tuples matching the pattern
+            List of (guid, name) tuples matching the pattern, sorted by name
         """
         pattern_lower = pattern.lower()
+        # A plain scan of the cached lowercase names, which are in name order. An
+        # n-gram index would only pay off over many searches, and the CLI runs a
+        # single search per process.
         return [
-            (guid, name) 
-            for guid, name in self.guid_to_name.items() 
-            if pattern_lower in name.lower()
+            item
+            for item, name_lower in zip(self.sorted_by_name, self.names_lower)
+            if pattern_lower in name_lower
         ]
 
+    def search_by_prefix(self, prefix: str) -> List[Tuple[str, str]]:
+        """Search for attributes whose name starts with a prefix.
 
-def set_plain_output(plain: bool) -> None:
-    """Set plain output mode globally."""
-    global _PLAIN_OUTPUT
-    _PLAIN_OUTPUT = plain
+        Args:
+            prefix: Name prefix (case-insensitive)
 
+        Returns:
+            List of (guid, name) tuples matching the prefix, sorted by name
+        """
+        prefix_lower = prefix.lower()
+        index = self.prefix_index
+        matches = []
+        for name_lower, guid, name in islice(
+            index, bisect_left(index, prefix_lower, key=itemgetter(0)), None
+        ):
+            if not name_lower.startswith(prefix_lower):
+                break
+            matches.append((guid, name))
+        return sorted(matches, key=itemgetter(1))
 
-def supports_color() -> bool:
-    """Check if terminal supports ANSI colors."""
-    if _PLAIN_OUTPUT:
-        return False
-    return (
+
+def _detect_color() -> bool:
+    """Probe whether stdout is a terminal that accepts ANSI colors."""
+    return not _PLAIN_OUTPUT and (
         hasattr(sys.stdout, "isatty")
         and sys.stdout.isatty()
         and os.getenv("TERM") != "dumb"
@@ -130,21 +253,53 @@ def supports_color() -> bool:
     )
 
 
+def set_plain_output(plain: bool) -> None:
+    """Set plain output mode globally."""
+    global _PLAIN_OUTPUT, _COLOR_ENABLED
+    _PLAIN_OUTPUT = plain
+    _COLOR_ENABLED = _detect_color()
+
+
+def supports_color() -> bool:
+    """Check if terminal supports ANSI colors (cached, see set_plain_output)."""
+    return _COLOR_ENABLED
+
+
+# Whether output is colorized; probed at import and whenever the output mode changes
+_COLOR_ENABLED = _detect_color()
+
+
 def colorize(text: str, color: str = "", reset: bool = True) -> str:
     """Apply color to text if terminal supports it."""
-    if not supports_color():
+    if not _COLOR_ENABLED:
         return text
 
-    result = f"{color}{text}"
     if reset:
-        result += Colors.RESET
-    return result
+        return f"{color}{text}{Colors.RESET}"
+    return f"{color}{text}"
+
+
+# Color placeholders for line_format templates, with and without ANSI codes
+_ANSI_CODES = {key: value for key, value in vars(Colors).items() if key.isupper()}
+_NO_ANSI_CODES = dict.fromkeys(_ANSI_CODES, "")
+
+
+def line_format(template: str) -> str:
+    """Resolve the {COLOR} placeholders of a %-style line template.
+
+    Hot output loops resolve their templates once and render each line with a
+    single % operation instead of several nested colorize() calls.
+
+    Example:
+        line_format("  {GRAY}%3d.{RESET} {YELLOW}%s{RESET}") % (1, guid)
+    """
+    return template.format_map(_ANSI_CODES if supports_color() else _NO_ANSI_CODES)
 
 
 def print_header(title: str, subtitle: str = "") -> None:
     """Print a formatted header."""
     print()
-    print(colorize(f"┌─ {title}", Colors.BOLD + Colors.CYAN))
+    print(colorize(f"┌─ {title}", _HEADER_STYLE))
     if subtitle:
         print(colorize(f"│  {subtitle}", Colors.DIM))
     print(colorize("└─", Colors.CYAN))
@@ -175,39 +330,81 @@ def format_guid(guid: str) -> str:
 
 def format_attribute_name(name: str) -> str:
     """Format attribute name with color."""
-    return colorize(name, Colors.GREEN + Colors.BOLD)
+    return colorize(name, _NAME_STYLE)
 
 
 def format_count(count: int) -> str:
     """Format count with color."""
-    return colorize(str(count), Colors.CYAN + Colors.BOLD)
+    return colorize(str(count), _COUNT_STYLE)
+
+
+def write_lines_file(output_file: Path, lines: Iterable[str]) -> None:
+    """Write lines to a file as one joined string with a single write call."""
+    content = "".join([f"{line}\n" for line in lines])
+    with open(output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(content)
+
+
+def write_plain_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout as one pre-encoded block.
+
+    The text is encoded once and handed to the underlying binary buffer,
+    bypassing the TextIOWrapper. Falls back to a plain write when stdout has no
+    binary buffer or the platform needs newline translation.
+    """
+    data = "".join([f"{line}\n" for line in lines])
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or os.linesep != "\n":
+        sys.stdout.write(data)
+        return
+    sys.stdout.flush()  # Keep ordering with anything already printed
+    buffer.write(data.encode(sys.stdout.encoding, sys.stdout.errors))
 
 
 def export_mappings(
-    mappings: Dict[str, str], format_type: str, output_file: Optional[Path] = None
+    lookup: SchemaLookup, format_type: str, output_file: Optional[Path] = None
 ) -> None:
     """Export schema mappings in specified format."""
+    mappings = lookup.guid_to_name
+
     # Generate filename if not provided
     if not output_file:
         output_file = Path(f"ad_schema_attributes.{format_type}")
 
     try:
-        if format_type == "json":
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(mappings, f, indent=2, sort_keys=True)
+        # Large write buffers keep the export to a handful of syscalls
+        if format_type == "json" and orjson is not None:
+            Path(output_file).write_bytes(
+                orjson.dumps(mappings, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+
+        elif format_type == "json":
+            import json
+
+            # Serialize in one call rather than letting json.dump issue many
+            # small writes; sorting the items once matches sort_keys=True
+            content = json.dumps(dict(sorted(mappings.items())), indent=2)
+            with open(output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(content)
 
         elif format_type == "csv":
-            with open(output_file, "w", encoding="utf-8", newline="") as f:
+            import csv
+
+            with open(
+                output_file, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
                 writer = csv.writer(f)
                 writer.writerow(["GUID", "AttributeName"])  # Header
-                for guid, name in sorted(mappings.items(), key=lambda x: x[1]):
-                    writer.writerow([guid, name])
+                writer.writerows(lookup.sorted_by_name)
 
         elif format_type == "tsv":
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("GUID\tAttributeName\n")  # Header
-                for guid, name in sorted(mappings.items(), key=lambda x: x[1]):
-                    f.write(f"{guid}\t{name}\n")
+            write_lines_file(
+                output_file,
+                [
+                    "GUID\tAttributeName",  # Header
+                    *(f"{guid}\t{name}" for guid, name in lookup.sorted_by_name),
+                ],
+            )
 
         if _PLAIN_OUTPUT:
             print(f"Exported {len(mappings)} mappings to {output_file}")
@@ -224,25 +421,136 @@ def export_mappings(
         sys.exit(1)
 
 
-def load_schema_mappings(json_file: Path) -> Dict[str, str]:
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory, $XDG_CACHE_HOME/ad-schema-tool.
+
+    All caches live here rather than next to their inputs or in the working
+    directory, so running the tool never picks up files planted there.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "ad-schema-tool"
+
+
+def _mappings_cache_path(json_file: Path) -> Path:
+    """Return the per-user file caching the mappings of a schema file.
+
+    The file is keyed by a hash of the resolved schema path, so nothing is
+    written next to the schema.
+    """
+    import hashlib
+
+    digest = hashlib.sha1(str(Path(json_file).resolve()).encode()).hexdigest()
+    return user_cache_dir() / f"{digest}.marshal"
+
+
+def _mappings_cache_key(json_file: Path) -> Tuple[int, str, int, int]:
+    """Return the key a cache entry must match to be used for json_file."""
+    stat = os.stat(json_file)
+    return (
+        MAPPINGS_CACHE_VERSION,
+        str(Path(json_file).resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def _load_cached_mappings(
+    json_file: Path, key: Tuple[int, str, int, int]
+) -> Optional[Dict[str, str]]:
+    """Return cached mappings, or None if the cache is missing or stale."""
+    # marshal only restores plain data here, unlike pickle it runs no code
+    import marshal
+
+    try:
+        with open(_mappings_cache_path(json_file), "rb") as f:
+            cached_key, mappings = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        # Missing, truncated or foreign cache files are simply rebuilt
+        return None
+    if cached_key != key or type(mappings) is not dict:
+        return None
+    return mappings
+
+
+def _save_cached_mappings(
+    json_file: Path, key: Tuple[int, str, int, int], mappings: Dict[str, str]
+) -> None:
+    """Write mappings to the per-user cache for later runs.
+
+    key must be taken before json_file was read, so a file replaced while it
+    was being parsed is not cached under the new file's key.
+    """
+    import marshal
+
+    cache_path = _mappings_cache_path(json_file)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((key, mappings), f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        # The cache is optional, e.g. the cache directory may not be writable
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def load_schema_mappings(json_file: Path, use_cache: bool = True) -> Dict[str, str]:
     """Load schema mappings from enhanced JSON file.
 
     Converts from enhanced JSON format (GUID -> {ldapDisplayName, ...})
-    to simple mapping format (GUID -> ldapDisplayName).
+    to simple mapping format (GUID -> ldapDisplayName). The result is cached
+    per user under $XDG_CACHE_HOME/ad-schema-tool and reused until the JSON
+    file changes.
     """
+    cache_key = None
+    if use_cache:
+        try:
+            cache_key = _mappings_cache_key(json_file)
+        except OSError:
+            pass  # Reported when the file itself is opened below
+        else:
+            mappings = _load_cached_mappings(json_file, cache_key)
+            if mappings is not None:
+                return mappings
+
+    # Imported here so commands that never load a schema skip the cost
+    import json
+    import mmap
+
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            enhanced_data = json.load(f)
+        if orjson is not None:
+            # Parse straight from a read-only mapping of the file instead of a
+            # read() copy; orjson.JSONDecodeError subclasses json.JSONDecodeError
+            with open(json_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # An empty file can't be mapped, let orjson report it
+                    enhanced_data = orjson.loads(b"")
+                else:
+                    # The view is listed last so it is released before the mapping
+                    # is closed
+                    with (
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                        memoryview(mm) as view,
+                    ):
+                        enhanced_data = orjson.loads(view)
+        else:
+            with open(json_file, "r", encoding="utf-8") as f:
+                enhanced_data = json.load(f)
 
         # Convert enhanced format to simple GUID -> ldapDisplayName mapping
-        mappings = {}
-        for guid, attr_data in enhanced_data.items():
-            ldap_display_name = attr_data.get(
-                "ldapDisplayName", attr_data.get("cn", f"Unknown-{guid}")
+        mappings = {
+            guid: (
+                attr_data["ldapDisplayName"]
+                if "ldapDisplayName" in attr_data
+                else attr_data.get("cn", f"Unknown-{guid}")
             )
-            mappings[guid] = ldap_display_name
-
-        return mappings
+            for guid, attr_data in enhanced_data.items()
+        }
     except FileNotFoundError:
         print_error(f"Schema mapping file not found: {json_file}")
         sys.exit(1)
@@ -250,11 +558,15 @@ def load_schema_mappings(json_file: Path) -> Dict[str, str]:
         print_error(f"Invalid JSON in schema mapping file: {e}")
         sys.exit(1)
 
+    if cache_key is not None:
+        _save_cached_mappings(json_file, cache_key, mappings)
+    return mappings
+
 
 def lookup_guid(lookup: SchemaLookup, guid: str) -> None:
     """Look up attribute name for a GUID."""
     normalized_guid = normalize_guid(guid)
-    name = lookup.lookup_by_guid(guid)
+    name = lookup.guid_to_name.get(normalized_guid)
     if name:
         if _PLAIN_OUTPUT:
             print(f"{normalized_guid}\t{name}")
@@ -290,63 +602,69 @@ def lookup_name(lookup: SchemaLookup, name: str) -> None:
         sys.exit(1)
 
 
-def search_pattern(lookup: SchemaLookup, pattern: str) -> None:
-    """Search for attributes matching a pattern."""
-    matches = lookup.search_by_pattern(pattern)
+def search_pattern(
+    lookup: SchemaLookup, pattern: str, prefix: bool = False, limit: Optional[int] = None
+) -> None:
+    """Search for attributes matching a pattern (or starting with it if prefix).
+
+    If limit is set, only the first limit matches in name order are shown.
+    """
+    # Collect (name, guid, lowercased name) in name order, keeping each
+    # lowercased name for highlighting
+    pattern_lower = pattern.lower()
+    found = lookup.search_by_prefix(pattern) if prefix else lookup.search_by_pattern(pattern)
+    total_count = len(found)
+    matches = [(name, guid, name.lower()) for guid, name in islice(found, limit)]
 
     if matches:
         if _PLAIN_OUTPUT:
-            for guid, name in sorted(matches, key=lambda x: x[1]):
-                print(f"{name}\t{guid}")
+            write_plain_lines(f"{name}\t{guid}" for name, guid, _ in matches)
         else:
-            print_header(
-                "🔎 Search Results",
-                f"Found {format_count(len(matches))} attributes matching '{colorize(pattern, Colors.MAGENTA)}'",
-            )
+            subtitle = f"Found {format_count(total_count)} attributes matching '{colorize(pattern, Colors.MAGENTA)}'"
+            if len(matches) < total_count:
+                subtitle += f", showing the first {format_count(len(matches))}"
+            print_header("🔎 Search Results", subtitle)
+
+            # The pattern is a literal, so highlight with a plain substring scan
+            pattern_len = len(pattern_lower)
+            highlight = supports_color() and pattern_len > 0
+            name_fmt = line_format("{GREEN}{BOLD}%s{RESET}")
+            match_fmt = line_format("{MAGENTA}{BOLD}%s{RESET}")
+            row_fmt = line_format("  {GRAY}%3d.{RESET} %s\n       {DIM}GUID:{RESET} {YELLOW}%s{RESET}\n")
 
             # Group results nicely
-            for i, (guid, name) in enumerate(sorted(matches, key=lambda x: x[1]), 1):
+            lines = []
+            for i, (name, guid, name_lower) in enumerate(matches, 1):
                 # Highlight the matching pattern in the name (case-insensitive)
-                if supports_color():
-                    import re
-
-                    # Find all matches of the pattern (case-insensitive)
-                    matches_iter = re.finditer(re.escape(pattern), name, re.IGNORECASE)
-
+                if highlight:
                     formatted_parts = []
                     last_end = 0
 
-                    for match in matches_iter:
+                    # Find all matches of the pattern (case-insensitive)
+                    start = name_lower.find(pattern_lower)
+                    while start != -1:
                         # Add text before the match (in green)
-                        if match.start() > last_end:
-                            formatted_parts.append(
-                                colorize(
-                                    name[last_end : match.start()],
-                                    Colors.GREEN + Colors.BOLD,
-                                )
-                            )
+                        if start > last_end:
+                            formatted_parts.append(name_fmt % name[last_end:start])
                         # Add the highlighted match (in magenta)
-                        formatted_parts.append(
-                            colorize(match.group(0), Colors.MAGENTA + Colors.BOLD)
-                        )
-                        last_end = match.end()
+                        last_end = start + pattern_len
+                        formatted_parts.append(match_fmt % name[start:last_end])
+                        start = name_lower.find(pattern_lower, last_end)
 
                     # Add remaining text after last match (in green)
                     if last_end < len(name):
-                        formatted_parts.append(
-                            colorize(name[last_end:], Colors.GREEN + Colors.BOLD)
-                        )
+                        formatted_parts.append(name_fmt % name[last_end:])
 
                     formatted_name = "".join(formatted_parts)
                 else:
-                    formatted_name = format_attribute_name(name)
+                    formatted_name = name_fmt % name
 
-                print(f"  {colorize(f'{i:3}.', Colors.GRAY)} {formatted_name}")
-                print(f"       {colorize('GUID:', Colors.DIM)} {format_guid(guid)}")
+                lines.append(row_fmt % (i, formatted_name, guid))
 
                 # Add spacing every 5 items for readability
                 if i % 5 == 0 and i < len(matches):
-                    print()
+                    lines.append("\n")
+            sys.stdout.write("".join(lines))
     else:
         if _PLAIN_OUTPUT:
             print(f"ERROR: No attributes found matching '{pattern}'", file=sys.stderr)
@@ -361,6 +679,7 @@ def intersect_files(
     file_paths: list[Path],
     annotate: bool = False,
     output_file: Optional[Path] = None,
+    assume_sorted: bool = False,
 ) -> None:
     """Find intersection of GUIDs across multiple text files.
     
@@ -379,7 +698,8 @@ def intersect_files(
         include_all=file_paths,
         annotate=annotate,
         output_file=output_file,
-        operation_name="GUID Intersection"
+        operation_name="GUID Intersection",
+        assume_sorted=assume_sorted,
     )
 
 
@@ -396,8 +716,8 @@ def annotate_file(
         output_file: Optional output file, if None writes to stdout
     """
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        # One read plus a C-level split instead of a str per readline
+        lines = _read_text(input_file).split("\n")
     except FileNotFoundError:
         if _PLAIN_OUTPUT:
             print(f"ERROR: Input file not found: {input_file}", file=sys.stderr)
@@ -411,17 +731,19 @@ def annotate_file(
             print_error(f"Cannot read input file {colorize(str(input_file), Colors.CYAN)}: {e}")
         sys.exit(1)
 
-    # Process lines and build output
+    # Process lines and build output; GUIDs are normalized inline, so look them
+    # up in the mapping directly
+    get_name = lookup.guid_to_name.get
     output_lines = []
     found_count = 0
     total_count = 0
     
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith("#"):  # Skip empty lines and comments
+    for line in map(str.strip, lines):
+        if line and line[0] != "#":  # Skip empty lines and comments
             total_count += 1
-            normalized_guid = normalize_guid(line)
-            attribute_name = lookup.lookup_by_guid(normalized_guid)
+            # Inlined normalize_guid, the line is already stripped
+            normalized_guid = line[1:-1] if line[0] == "{" and line[-1] == "}" else line
+            attribute_name = get_name(normalized_guid)
             
             if attribute_name:
                 output_lines.append(f"{normalized_guid}\t{attribute_name}")
@@ -434,9 +756,7 @@ def annotate_file(
     # Write output
     if output_file:
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                for line in output_lines:
-                    f.write(f"{line}\n")
+            write_lines_file(output_file, output_lines)
             
             if _PLAIN_OUTPUT:
                 print(f"Annotated {found_count}/{total_count} GUIDs, wrote to {output_file}")
@@ -453,9 +773,8 @@ def annotate_file(
                 print_error(f"Failed to write output file: {e}")
             sys.exit(1)
     else:
-        # Write to stdout
-        for line in output_lines:
-            print(line)
+        # Write to stdout in one block
+        write_plain_lines(output_lines)
         
         # Show stats to stderr if not in plain mode
         if not _PLAIN_OUTPUT:
@@ -470,7 +789,7 @@ def unique_elements(
 ) -> None:
     """Find elements that are unique to each file (set difference analysis).
     
-    This function performs multiple subset analyses to find elements unique to each file.
+    Each file is read once; a GUID is unique to a file when no other file has it.
     """
     if len(file_paths) < 2:
         if _PLAIN_OUTPUT:
@@ -479,59 +798,29 @@ def unique_elements(
             print_error("Need at least 2 files for unique analysis")
         sys.exit(1)
 
+    # Read every file once, then a GUID is unique to a file when no other file
+    # has it. Collect the GUIDs shared by several files with whole-set
+    # operations, which run in C instead of counting per GUID
+    file_sets = _read_guid_sets(file_paths)
+    seen: Set[str] = set()
+    seen_multiple: Set[str] = set()
+    for guids in file_sets:
+        seen_multiple |= seen & guids
+        seen |= guids
+
     # Collect results for each file
     all_unique_results = []
     total_unique = 0
-    
-    for i, current_file in enumerate(file_paths):
-        # Get all other files to exclude
-        other_files = [file_paths[j] for j in range(len(file_paths)) if j != i]
-        
-        # Use subset_analysis to find elements unique to current file
-        # We'll capture the results by temporarily redirecting to a temp approach
-        # For now, let's use the original logic but simplified
-        
-        try:
-            with open(current_file, "r", encoding="utf-8") as f:
-                current_guids = set()
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        normalized_guid = normalize_guid(line)
-                        current_guids.add(normalized_guid)
-        except FileNotFoundError:
-            if _PLAIN_OUTPUT:
-                print(f"ERROR: File not found: {current_file}", file=sys.stderr)
-            else:
-                print_error(f"File not found: {colorize(str(current_file), Colors.CYAN)}")
-            sys.exit(1)
-        except OSError as e:
-            if _PLAIN_OUTPUT:
-                print(f"ERROR: Cannot read file {current_file}: {e}", file=sys.stderr)
-            else:
-                print_error(f"Cannot read file {colorize(str(current_file), Colors.CYAN)}: {e}")
-            sys.exit(1)
-        
-        # Get union of all other files
-        other_guids = set()
-        for other_file in other_files:
-            try:
-                with open(other_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            normalized_guid = normalize_guid(line)
-                            other_guids.add(normalized_guid)
-            except (FileNotFoundError, OSError):
-                continue  # Error handling was done above
-        
-        # Find unique elements
-        unique_to_current = current_guids - other_guids
+
+    for current_file, current_guids in zip(file_paths, file_sets):
+        unique_to_current = sorted(current_guids - seen_multiple)
         if unique_to_current:
             all_unique_results.append((current_file.name, unique_to_current))
             total_unique += len(unique_to_current)
 
-    # Generate output
+    # Generate output; the GUIDs are already normalized. Names (and so the
+    # schema) are only needed for annotated output
+    get_name = lookup.guid_to_name.get if annotate else None
     if total_unique == 0:
         if not output_file:
             if _PLAIN_OUTPUT:
@@ -546,9 +835,9 @@ def unique_elements(
         # File/plain format
         for file_name, unique_guids in all_unique_results:
             output_lines.append(f"# Elements unique to {file_name} ({len(unique_guids)} items)")
-            for guid in sorted(unique_guids):
+            for guid in unique_guids:
                 if annotate:
-                    name = lookup.lookup_by_guid(guid) or "Unknown"
+                    name = get_name(guid) or "Unknown"
                     output_lines.append(f"{guid}\t{name}")
                 else:
                     output_lines.append(guid)
@@ -557,9 +846,7 @@ def unique_elements(
     # Write to file if specified
     if output_file:
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                for line in output_lines:
-                    f.write(f"{line}\n")
+            write_lines_file(output_file, output_lines)
 
             if _PLAIN_OUTPUT:
                 print(f"Wrote {total_unique} unique GUIDs to {output_file}")
@@ -577,8 +864,7 @@ def unique_elements(
 
     # Console output
     if _PLAIN_OUTPUT and not output_file:
-        for line in output_lines:
-            print(line)
+        write_plain_lines(output_lines)
     elif not output_file:  # Fancy output
         print_header(
             "🔍 Unique GUID Analysis",
@@ -586,17 +872,203 @@ def unique_elements(
         )
 
         # Show results per file
+        annotated_fmt = line_format(
+            "  {GRAY}%3d.{RESET} {YELLOW}%s{RESET} {DIM}→{RESET} {GREEN}{BOLD}%s{RESET}"
+        )
+        guid_fmt = line_format("  {GRAY}%3d.{RESET} {YELLOW}%s{RESET}")
+        lines = []
         for file_name, unique_guids in all_unique_results:
-            print(colorize(f"Elements unique to {file_name} ({len(unique_guids)} items):", Colors.BOLD))
-            for i, guid in enumerate(sorted(unique_guids), 1):
+            lines.append(colorize(f"Elements unique to {file_name} ({len(unique_guids)} items):", Colors.BOLD))
+            for i, guid in enumerate(unique_guids, 1):
                 if annotate:
-                    name = lookup.lookup_by_guid(guid) or "Unknown"
-                    print(
-                        f"  {colorize(f'{i:3}.', Colors.GRAY)} {format_guid(guid)} {colorize('→', Colors.DIM)} {format_attribute_name(name)}"
-                    )
+                    name = get_name(guid) or "Unknown"
+                    lines.append(annotated_fmt % (i, guid, name))
                 else:
-                    print(f"  {colorize(f'{i:3}.', Colors.GRAY)} {format_guid(guid)}")
-            print()
+                    lines.append(guid_fmt % (i, guid))
+            lines.append("")
+        sys.stdout.write("".join([f"{line}\n" for line in lines]))
+
+
+def _exit_on_file_error(file_path: Path, error: OSError) -> NoReturn:
+    """Report that an input file couldn't be read and exit."""
+    if isinstance(error, FileNotFoundError):
+        if _PLAIN_OUTPUT:
+            print(f"ERROR: File not found: {file_path}", file=sys.stderr)
+        else:
+            print_error(f"File not found: {colorize(str(file_path), Colors.CYAN)}")
+    else:
+        if _PLAIN_OUTPUT:
+            print(f"ERROR: Cannot read file {file_path}: {error}", file=sys.stderr)
+        else:
+            print_error(f"Cannot read file {colorize(str(file_path), Colors.CYAN)}: {error}")
+    sys.exit(1)
+
+
+def _read_guid_sets(file_paths: List[Path]) -> List[Set[str]]:
+    """Read the GUID set of every file, exiting with an error if one can't be read.
+
+    The reads are independent and I/O bound, so they overlap in threads. Results
+    are collected in file order so errors are reported for the first failing file.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+        futures = [executor.submit(_read_guid_set, file_path) for file_path in file_paths]
+
+    file_sets = []
+    for file_path, future in zip(file_paths, futures):
+        try:
+            file_sets.append(future.result())
+        except OSError as e:
+            _exit_on_file_error(file_path, e)
+    return file_sets
+
+
+def _intersect_guid_files(file_paths: List[Path]) -> Set[str]:
+    """Intersect the GUIDs of several files, starting from the smallest file.
+
+    Only the smallest file is loaded as a set. The others are read line by line
+    and checked against the running intersection, which can only shrink, and
+    the remaining files are skipped once it is empty.
+    """
+    sizes = []
+    for file_path in file_paths:
+        try:
+            sizes.append(os.stat(file_path).st_size)
+        except OSError as e:
+            _exit_on_file_error(file_path, e)
+
+    result: Optional[Set[str]] = None
+    for _, file_path in sorted(zip(sizes, file_paths), key=itemgetter(0)):
+        try:
+            if result is None:
+                result = _read_guid_set(file_path)
+            else:
+                with open(
+                    file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE
+                ) as f:
+                    # Inlined normalize_guid, the lines are already stripped
+                    result = result.intersection(
+                        line[1:-1] if line[0] == "{" and line[-1] == "}" else line
+                        for line in map(str.strip, f)
+                        if line and line[0] != "#"
+                    )
+        except OSError as e:
+            _exit_on_file_error(file_path, e)
+        if not result:
+            break
+    return result
+
+
+def _compute_subset(
+    include_all: List[Path], include_any: List[Path], exclude: List[Path]
+) -> Set[str]:
+    """Read the given files and evaluate the include/exclude set expression."""
+    if include_all and not include_any and not exclude:
+        # A plain intersection only holds the smallest file's GUIDs as a set
+        return _intersect_guid_files(include_all)
+
+    all_files = include_all + include_any + exclude
+
+    # Read GUIDs from all files
+    file_data = dict(zip((f.name for f in all_files), _read_guid_sets(all_files)))
+
+    # Build include set
+    include_set = set()
+    
+    if include_all:
+        # Intersection: must be in ALL include_all files. Intersect in one C-level
+        # call, starting from the smallest set so the result shrinks fastest
+        all_sets = sorted((file_data[f.name] for f in include_all), key=len)
+        include_set = all_sets[0].intersection(*all_sets[1:])
+    
+    if include_any:
+        # Union: must be in ANY include_any files. The accumulators below are
+        # all fresh sets owned here, so they are updated in place
+        any_set = set()
+        for file_path in include_any:
+            any_set |= file_data[file_path.name]
+        
+        if include_all:
+            # Both include_all and include_any: intersection of (include_all result) and (include_any union)
+            include_set &= any_set
+        else:
+            # Only include_any: just the union
+            include_set = any_set
+    
+    # Final result: include_set minus every exclude file
+    for file_path in exclude:
+        include_set -= file_data[file_path.name]
+    return include_set
+
+
+class _UnsortedInputError(ValueError):
+    """A file passed to intersect --sorted is not in sorted order."""
+
+
+def _iter_sorted_guids(file_path: Path) -> Iterator[str]:
+    """Yield the distinct normalized GUIDs of a sorted file in order.
+
+    Raises:
+        _UnsortedInputError: If the GUIDs in the file are not in sorted order
+    """
+    previous = None
+    with open(file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            # The file is streamed once from start to end; a larger readahead
+            # window helps on cold caches. Not applicable to pipes.
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "#":  # Skip empty lines and comments
+                continue
+            # Inlined normalize_guid, the line is already stripped
+            guid = line[1:-1] if line[0] == "{" and line[-1] == "}" else line
+            if previous is not None and guid <= previous:
+                if guid == previous:
+                    continue  # Duplicate within the file
+                raise _UnsortedInputError(str(file_path))
+            previous = guid
+            yield guid
+
+
+def _intersect_sorted_files(file_paths: List[Path]) -> List[str]:
+    """Intersect pre-sorted GUID files by merging them as streams.
+
+    Memory use is independent of the file sizes: each file contributes one
+    GUID at a time, and a GUID is kept when it occurs once per file.
+    """
+    import heapq
+    from itertools import groupby
+
+    streams = [_iter_sorted_guids(file_path) for file_path in file_paths]
+    try:
+        return [
+            guid
+            for guid, group in groupby(heapq.merge(*streams))
+            if sum(1 for _ in group) == len(streams)
+        ]
+    except FileNotFoundError as e:
+        if _PLAIN_OUTPUT:
+            print(f"ERROR: File not found: {e.filename}", file=sys.stderr)
+        else:
+            print_error(f"File not found: {colorize(str(e.filename), Colors.CYAN)}")
+        sys.exit(1)
+    except OSError as e:
+        if _PLAIN_OUTPUT:
+            print(f"ERROR: Cannot read file {e.filename}: {e}", file=sys.stderr)
+        else:
+            print_error(f"Cannot read file {colorize(str(e.filename), Colors.CYAN)}: {e}")
+        sys.exit(1)
+    except _UnsortedInputError as e:
+        if _PLAIN_OUTPUT:
+            print(f"ERROR: File is not sorted: {e}", file=sys.stderr)
+        else:
+            print_error(f"File is not sorted: {colorize(str(e), Colors.CYAN)}")
+        sys.exit(1)
 
 
 def subset_analysis(
@@ -607,6 +1079,7 @@ def subset_analysis(
     annotate: bool = False,
     output_file: Optional[Path] = None,
     operation_name: str = "Subset Analysis",
+    assume_sorted: bool = False,
 ) -> None:
     """Universal set analysis function supporting include/exclude operations.
     
@@ -618,6 +1091,8 @@ def subset_analysis(
         annotate: Whether to show attribute names alongside GUIDs
         output_file: Optional file to write results to
         operation_name: Name for headers/output (e.g. "Intersection", "Unique Analysis")
+        assume_sorted: Input files are sorted, so a pure intersection can be
+            streamed instead of loading every file into memory
     """
     include_all = include_all or []
     include_any = include_any or []
@@ -631,65 +1106,17 @@ def subset_analysis(
             print_error("Need at least 1 file for analysis")
         sys.exit(1)
 
-    # Read GUIDs from all files
-    file_data = {}  # filename -> set of GUIDs
-    
-    for file_path in all_files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                guids = set()
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):  # Skip empty lines and comments
-                        normalized_guid = normalize_guid(line)
-                        guids.add(normalized_guid)
-                file_data[file_path.name] = guids
-
-        except FileNotFoundError:
-            if _PLAIN_OUTPUT:
-                print(f"ERROR: File not found: {file_path}", file=sys.stderr)
-            else:
-                print_error(f"File not found: {colorize(str(file_path), Colors.CYAN)}")
-            sys.exit(1)
-        except OSError as e:
-            if _PLAIN_OUTPUT:
-                print(f"ERROR: Cannot read file {file_path}: {e}", file=sys.stderr)
-            else:
-                print_error(f"Cannot read file {colorize(str(file_path), Colors.CYAN)}: {e}")
-            sys.exit(1)
-
-    # Build include set
-    include_set = set()
-    
-    if include_all:
-        # Intersection: must be in ALL include_all files
-        include_set = file_data[include_all[0].name].copy()
-        for file_path in include_all[1:]:
-            include_set = include_set.intersection(file_data[file_path.name])
-    
-    if include_any:
-        # Union: must be in ANY include_any files
-        any_set = set()
-        for file_path in include_any:
-            any_set = any_set.union(file_data[file_path.name])
-        
-        if include_all:
-            # Both include_all and include_any: intersection of (include_all result) and (include_any union)
-            include_set = include_set.intersection(any_set)
-        else:
-            # Only include_any: just the union
-            include_set = any_set
-    
-    # Build exclude set (union of all exclude files)
-    exclude_set = set()
-    for file_path in exclude:
-        exclude_set = exclude_set.union(file_data[file_path.name])
-    
-    # Final result: include_set - exclude_set
-    result_set = include_set - exclude_set
+    # Sort the result once; every output path below reuses sorted_guids
+    if assume_sorted and not include_any and not exclude:
+        # Stream a merge-based intersection of pre-sorted files in constant memory;
+        # the merge already yields GUIDs in sorted order
+        sorted_guids = _intersect_sorted_files(include_all)
+    else:
+        sorted_guids = sorted(_compute_subset(include_all, include_any, exclude))
+    result_count = len(sorted_guids)
 
     # Prepare output
-    if not result_set:
+    if not sorted_guids:
         if not output_file:
             if _PLAIN_OUTPUT:
                 print("No GUIDs found matching criteria", file=sys.stderr)
@@ -697,32 +1124,27 @@ def subset_analysis(
                 print_error("No GUIDs found matching the specified criteria")
         return
 
-    # Generate output content
-    output_lines = []
-    if output_file or _PLAIN_OUTPUT:
-        # Simple format for files and plain output
-        for guid in sorted(result_set):
-            if annotate:
-                name = lookup.lookup_by_guid(guid) or "Unknown"
-                output_lines.append(f"{guid}\t{name}")
-            else:
-                output_lines.append(guid)
+    # Generate output content; GUIDs read from the input files are already
+    # normalized, so names are resolved with direct dict lookups. The schema
+    # is only needed (and loaded) for annotated output
+    get_name = lookup.guid_to_name.get if annotate else None
+    if annotate and (output_file or _PLAIN_OUTPUT):
+        # Simple format for files and plain output; the fancy console output
+        # below renders its rows directly
+        output_lines = [f"{guid}\t{get_name(guid) or 'Unknown'}" for guid in sorted_guids]
     else:
-        # Store for fancy console output  
-        output_lines = [(guid, lookup.lookup_by_guid(guid) or "Unknown") for guid in sorted(result_set)]
+        output_lines = sorted_guids
 
     # Write to file if specified
     if output_file:
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                for line in output_lines:
-                    f.write(f"{line}\n")
+            write_lines_file(output_file, output_lines)
 
             if _PLAIN_OUTPUT:
-                print(f"Wrote {len(result_set)} GUIDs to {output_file}")
+                print(f"Wrote {result_count} GUIDs to {output_file}")
             else:
                 print_success(
-                    f"Wrote {format_count(len(result_set))} GUIDs to {colorize(str(output_file), Colors.CYAN)}"
+                    f"Wrote {format_count(result_count)} GUIDs to {colorize(str(output_file), Colors.CYAN)}"
                 )
 
         except OSError as e:
@@ -734,12 +1156,11 @@ def subset_analysis(
 
     # Console output
     if _PLAIN_OUTPUT and not output_file:
-        for line in output_lines:
-            print(line)
+        write_plain_lines(output_lines)
     elif not output_file:  # Fancy output only when not writing to file
         print_header(
             f"🔍 {operation_name} Results",
-            f"Found {format_count(len(result_set))} GUIDs matching criteria",
+            f"Found {format_count(result_count)} GUIDs matching criteria",
         )
 
         # Show operation details
@@ -755,28 +1176,32 @@ def subset_analysis(
             print(f"  Exclude: {', '.join(file_names)}")
         print()
 
-        # Show results
-        for i, item in enumerate(output_lines, 1):
+        # Show results, rendering rows straight from the sorted GUIDs
+        if annotate:
+            row_fmt = line_format(
+                "  {GRAY}%3d.{RESET} {YELLOW}%s{RESET} {DIM}→{RESET} {GREEN}{BOLD}%s{RESET}\n"
+            )
+        else:
+            row_fmt = line_format("  {GRAY}%3d.{RESET} {YELLOW}%s{RESET}\n")
+        lines = []
+        for i, guid in enumerate(sorted_guids, 1):
             if annotate:
-                guid, name = item
-                print(
-                    f"  {colorize(f'{i:3}.', Colors.GRAY)} {format_guid(guid)} {colorize('→', Colors.DIM)} {format_attribute_name(name)}"
-                )
+                lines.append(row_fmt % (i, guid, get_name(guid) or "Unknown"))
             else:
-                guid, name = item
-                print(f"  {colorize(f'{i:3}.', Colors.GRAY)} {format_guid(guid)}")
+                lines.append(row_fmt % (i, guid))
 
             # Add spacing every 5 items for readability
-            if i % 5 == 0 and i < len(output_lines):
-                print()
+            if i % 5 == 0 and i < result_count:
+                lines.append("\n")
+        sys.stdout.write("".join(lines))
 
 
 def list_all(lookup: SchemaLookup) -> None:
     """List all schema attributes."""
     mappings = lookup.guid_to_name
     if _PLAIN_OUTPUT:
-        for guid, name in sorted(mappings.items(), key=lambda x: x[1]):
-            print(f"{name}\t{guid}")
+        # Render the whole listing and write it at once instead of per line
+        write_plain_lines(f"{name}\t{guid}" for guid, name in lookup.sorted_by_name)
     else:
         print_header(
             "📚 All AD Schema Attributes",
@@ -790,27 +1215,40 @@ def list_all(lookup: SchemaLookup) -> None:
             )
             print()
 
-        for i, (guid, name) in enumerate(
-            sorted(mappings.items(), key=lambda x: x[1]), 1
-        ):
-            print(f"  {colorize(f'{i:4}.', Colors.GRAY)} {format_attribute_name(name)}")
-            print(f"         {colorize('GUID:', Colors.DIM)} {format_guid(guid)}")
+        row_fmt = line_format(
+            "  {GRAY}%4d.{RESET} {GREEN}{BOLD}%s{RESET}\n         {DIM}GUID:{RESET} {YELLOW}%s{RESET}\n"
+        )
+        lines = []
+        for i, (guid, name) in enumerate(lookup.sorted_by_name, 1):
+            lines.append(row_fmt % (i, name, guid))
 
             # Add spacing every 10 items for readability
             if i % 10 == 0 and i < len(mappings):
-                print()
+                lines.append("\n")
+        sys.stdout.write("".join(lines))
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_parser() -> type:
+    """Import and return MSADAPDFParser from the scripts directory (once)."""
+    scripts_dir = str(Path(__file__).parent.parent.parent / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    from parse_ms_ada_pdfs import MSADAPDFParser
+
+    return MSADAPDFParser
 
 
 def build_schema_from_pdfs(
-    pdf_files: List[Path], output_file: Path, show_stats: bool = False
+    pdf_files: List[Path],
+    output_file: Path,
+    show_stats: bool = False,
+    use_cache: bool = True,
 ) -> None:
     """Build enhanced schema from Microsoft AD Schema PDF documents."""
     try:
         # Import PDF parsing functionality
-        import sys
-
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-        from parse_ms_ada_pdfs import MSADAPDFParser
+        MSADAPDFParser = _get_pdf_parser()
     except ImportError as e:
         print_error(f"Unable to import PDF parsing modules: {e}")
         print_info("Make sure PyMuPDF is installed: uv add pymupdf")
@@ -827,17 +1265,16 @@ def build_schema_from_pdfs(
     print_info(f"Building enhanced AD schema from {len(pdf_files)} PDF file(s)...")
 
     # Parse PDFs and create enhanced schema directly
-    parser = MSADAPDFParser()
+    parser = MSADAPDFParser(cache_dir=user_cache_dir() / "pdf" if use_cache else None)
     attributes = parser.parse_multiple_pdfs(pdf_files)
 
     if show_stats:
         print_info(f"Parsed {len(attributes)} attributes from PDFs")
 
         # Show PDF stats
-        pdf_counts = {}
-        for attr in attributes.values():
-            pdf = attr.source_pdf or "unknown"
-            pdf_counts[pdf] = pdf_counts.get(pdf, 0) + 1
+        from collections import Counter
+
+        pdf_counts = Counter(attr.source_pdf or "unknown" for attr in attributes.values())
 
         print_info("Attributes per PDF:")
         for pdf, count in sorted(pdf_counts.items()):
@@ -848,91 +1285,58 @@ def build_schema_from_pdfs(
     print_success(f"Enhanced schema built successfully: {output_file}")
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="AD Schema Mapping Tool - Convert between GUIDs and attribute names",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""Examples:
-  # Build schema from Microsoft PDF documents
-  ad-schema-tool build-schema ms-ada1.pdf ms-ada2.pdf ms-ada3.pdf --stats
-  
-  # Look up attribute name by GUID
-  ad-schema-tool lookup-guid bf967944-0de6-11d0-a285-00aa003049e2
-  
-  # Look up GUID by attribute name (plain output for scripts)
-  ad-schema-tool --plain lookup-name cost
-  
-  # Search for attributes
-  ad-schema-tool search msTS
-  
-  # Find common GUIDs across multiple files
-  ad-schema-tool intersect file1.txt file2.txt file3.txt
-  
-  # Find intersection with attribute names
-  ad-schema-tool intersect --annotate file1.txt file2.txt
-  
-  # Write intersection results to file
-  ad-schema-tool intersect --output results.txt file1.txt file2.txt
-  
-  # Annotate a file with GUIDs by adding attribute names
-  ad-schema-tool annotate guids.txt --output annotated.txt
-  
-  # Find GUIDs that are unique to each file
-  ad-schema-tool unique file1.txt file2.txt file3.txt --output unique_analysis.txt
-  
-  # Advanced set operations: GUIDs in A and B, but not in C
-  ad-schema-tool subset --include fileA.txt fileB.txt --exclude fileC.txt
-  
-  # List all attributes with plain output
-  ad-schema-tool --plain list
-""",
-    )
-
-    parser.add_argument(
-        "--schema-file",
-        "-s",
-        type=Path,
-        default=Path("ad_schema_enhanced.json"),
-        help="Path to enhanced schema JSON file",
-    )
-
-    parser.add_argument(
-        "--plain",
-        "-p",
-        action="store_true",
-        help="Plain output format (no colors/formatting, tab-separated)",
-    )
-
-    parser.add_argument(
-        "--export",
-        "-e",
-        choices=["csv", "json", "tsv"],
-        help="Export all mappings in specified format",
-    )
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of at least one."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Lookup GUID command
+def _add_lookup_guid_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the lookup-guid command."""
     lookup_guid_parser = subparsers.add_parser(
         "lookup-guid", help="Look up attribute name by GUID"
     )
     lookup_guid_parser.add_argument("guid", help="Schema GUID to look up")
 
-    # Lookup name command
+
+def _add_lookup_name_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the lookup-name command."""
     lookup_name_parser = subparsers.add_parser(
         "lookup-name", help="Look up GUID by attribute name"
     )
     lookup_name_parser.add_argument("name", help="Attribute name to look up")
 
-    # Search command
+
+def _add_search_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the search command."""
     search_parser = subparsers.add_parser("search", help="Search attributes by pattern")
     search_parser.add_argument("pattern", help="Search pattern (case-insensitive)")
+    search_parser.add_argument(
+        "--prefix",
+        action="store_true",
+        help="Only match attribute names starting with the pattern",
+    )
+    search_parser.add_argument(
+        "--limit",
+        "-n",
+        type=_positive_int,
+        metavar="N",
+        help="Show at most N matches",
+    )
 
-    # List command
+
+def _add_list_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the list command."""
     subparsers.add_parser("list", help="List all schema attributes")
 
-    # Intersect command
+
+def _add_intersect_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the intersect command."""
     intersect_parser = subparsers.add_parser(
         "intersect", help="Find common GUIDs across multiple text files"
     )
@@ -948,8 +1352,15 @@ def main() -> None:
     intersect_parser.add_argument(
         "--output", "-o", type=Path, help="Write results to file instead of console"
     )
+    intersect_parser.add_argument(
+        "--sorted",
+        action="store_true",
+        help="Input files are sorted (e.g. LC_ALL=C sort); stream them instead of loading into memory",
+    )
+
 
-    # Annotate command
+def _add_annotate_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the annotate command."""
     annotate_parser = subparsers.add_parser(
         "annotate", help="Annotate a file containing GUIDs by adding attribute names"
     )
@@ -960,7 +1371,9 @@ def main() -> None:
         "--output", "-o", type=Path, help="Output file for annotated results (default: stdout)"
     )
 
-    # Unique elements command
+
+def _add_unique_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the unique command."""
     unique_parser = subparsers.add_parser(
         "unique", help="Find GUIDs that are unique to each input file"
     )
@@ -977,7 +1390,9 @@ def main() -> None:
         "--output", "-o", type=Path, help="Write results to file instead of console"
     )
 
-    # Subset analysis command  
+
+def _add_subset_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the subset command."""
     subset_parser = subparsers.add_parser(
         "subset", help="Advanced set operations with include/exclude logic"
     )
@@ -1009,7 +1424,9 @@ def main() -> None:
         "--output", "-o", type=Path, help="Write results to file instead of console"
     )
 
-    # Build schema command
+
+def _add_build_schema_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the build-schema command."""
     build_parser = subparsers.add_parser(
         "build-schema", help="Build enhanced schema from Microsoft PDF documents"
     )
@@ -1031,24 +1448,223 @@ def main() -> None:
         action="store_true",
         help="Show parsing and building statistics",
     )
+    build_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Reparse all PDFs instead of reusing the per-user parse cache",
+    )
+
 
-    # Export command
+def _add_export_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the export command."""
     export_parser = subparsers.add_parser("export", help="Export all mappings to file")
     export_parser.add_argument(
         "format", choices=["csv", "json", "tsv"], help="Export format"
     )
     export_parser.add_argument("--output", "-o", type=Path, help="Output filename")
 
-    args = parser.parse_args()
+
+# Subcommand name -> function registering its parser, in help order
+_SUBPARSER_BUILDERS = {
+    "lookup-guid": _add_lookup_guid_parser,
+    "lookup-name": _add_lookup_name_parser,
+    "search": _add_search_parser,
+    "list": _add_list_parser,
+    "intersect": _add_intersect_parser,
+    "annotate": _add_annotate_parser,
+    "unique": _add_unique_parser,
+    "subset": _add_subset_parser,
+    "build-schema": _add_build_schema_parser,
+    "export": _add_export_parser,
+}
+
+# Global options that consume the following argument as their value
+_GLOBAL_VALUE_OPTIONS = frozenset({"--schema-file", "-s", "--export", "-e"})
+
+
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if it isn't a known one."""
+    arguments = iter(argv)
+    for argument in arguments:
+        if argument == "-h" or (len(argument) > 2 and "--help".startswith(argument)):
+            # Top-level help (argparse also accepts --help abbreviated) lists
+            # every command, so it needs the full parser
+            return None
+        if argument in _GLOBAL_VALUE_OPTIONS:
+            next(arguments, None)
+        elif not argument.startswith("-"):
+            return argument if argument in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Only the subparser of a known command is registered, which keeps startup
+    cheap for short commands. Without one (help, typos, no command) every
+    subparser is registered so usage and error messages list them all.
+    """
+    parser = argparse.ArgumentParser(
+        description="AD Schema Mapping Tool - Convert between GUIDs and attribute names",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+  # Build schema from Microsoft PDF documents
+  ad-schema-tool build-schema ms-ada1.pdf ms-ada2.pdf ms-ada3.pdf --stats
+  
+  # Look up attribute name by GUID
+  ad-schema-tool lookup-guid bf967944-0de6-11d0-a285-00aa003049e2
+  
+  # Look up GUID by attribute name (plain output for scripts)
+  ad-schema-tool --plain lookup-name cost
+  
+  # Search for attributes
+  ad-schema-tool search msTS
+  
+  # Find common GUIDs across multiple files
+  ad-schema-tool intersect file1.txt file2.txt file3.txt
+  
+  # Find intersection with attribute names
+  ad-schema-tool intersect --annotate file1.txt file2.txt
+  
+  # Write intersection results to file
+  ad-schema-tool intersect --output results.txt file1.txt file2.txt
+  
+  # Annotate a file with GUIDs by adding attribute names
+  ad-schema-tool annotate guids.txt --output annotated.txt
+  
+  # Find GUIDs that are unique to each file
+  ad-schema-tool unique file1.txt file2.txt file3.txt --output unique_analysis.txt
+  
+  # Advanced set operations: GUIDs in A and B, but not in C
+  ad-schema-tool subset --include fileA.txt fileB.txt --exclude fileC.txt
+  
+  # List all attributes with plain output
+  ad-schema-tool --plain list
+""",
+    )
+
+    parser.add_argument(
+        "--schema-file",
+        "-s",
+        type=Path,
+        default=DEFAULT_SCHEMA_FILE,
+        help="Path to enhanced schema JSON file",
+    )
+
+    parser.add_argument(
+        "--plain",
+        "-p",
+        action="store_true",
+        help="Plain output format (no colors/formatting, tab-separated)",
+    )
+
+    parser.add_argument(
+        "--export",
+        "-e",
+        choices=["csv", "json", "tsv"],
+        help="Export all mappings in specified format",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        dest="skip_cache",
+        action="store_true",
+        help="Do not read or write cached data (schema mappings, PDF parse results)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in _SUBPARSER_BUILDERS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def _run_subset(args: argparse.Namespace, lookup: SchemaLookup) -> None:
+    """Validate the subset options and run the subset analysis."""
+    # Validate that at least one include option is provided
+    if not args.include and not args.include_any:
+        if _PLAIN_OUTPUT:
+            print("ERROR: Must specify at least one of --include or --include-any", file=sys.stderr)
+        else:
+            print_error("Must specify at least one of --include or --include-any")
+        sys.exit(1)
+    
+    subset_analysis(
+        lookup=lookup,
+        include_all=args.include,
+        include_any=args.include_any, 
+        exclude=args.exclude,
+        annotate=args.annotate,
+        output_file=args.output,
+        operation_name="Subset Analysis"
+    )
+
+
+# Subcommand name -> handler called with the parsed arguments and the lookup
+_COMMAND_HANDLERS = {
+    "lookup-guid": lambda args, lookup: lookup_guid(lookup, args.guid),
+    "lookup-name": lambda args, lookup: lookup_name(lookup, args.name),
+    "search": lambda args, lookup: search_pattern(
+        lookup, args.pattern, args.prefix, args.limit
+    ),
+    "list": lambda args, lookup: list_all(lookup),
+    "intersect": lambda args, lookup: intersect_files(
+        lookup, args.files, args.annotate, args.output, args.sorted
+    ),
+    "annotate": lambda args, lookup: annotate_file(lookup, args.input_file, args.output),
+    "unique": lambda args, lookup: unique_elements(
+        lookup, args.files, args.annotate, args.output
+    ),
+    "subset": _run_subset,
+    "export": lambda args, lookup: export_mappings(lookup, args.format, args.output),
+}
+
+
+def _run_fast_lookup(argv: List[str]) -> bool:
+    """Run a simple lookup-guid/lookup-name call without argparse.
+
+    Scripts call these in tight loops, so the plain forms
+    ``[--plain|-p] lookup-guid|lookup-name VALUE`` skip building and running
+    the parser. Returns False if argv needs the full parser.
+    """
+    plain = bool(argv) and argv[0] in ("--plain", "-p")
+    rest = argv[1:] if plain else argv
+    if len(rest) != 2 or rest[1].startswith("-"):
+        return False
+    if rest[0] == "lookup-guid":
+        command = lookup_guid
+    elif rest[0] == "lookup-name":
+        command = lookup_name
+    else:
+        return False
+
+    if plain:
+        set_plain_output(True)
+    command(SchemaLookup(schema_file=DEFAULT_SCHEMA_FILE), rest[1])
+    return True
+
+
+def _run_cli() -> None:
+    """Parse arguments and run the requested command."""
+    argv = sys.argv[1:]
+    if _run_fast_lookup(argv):
+        return
+    parser = _build_parser(_peek_command(argv))
+    args = parser.parse_args(argv)
 
     # Set plain output mode if requested (global option)
     if args.plain:
         set_plain_output(True)
 
+    # The schema is loaded when a command first needs it; set operations
+    # without --annotate never do
+    lookup = SchemaLookup(schema_file=args.schema_file, use_cache=not args.skip_cache)
+
     # Handle export without subcommand
     if args.export and not args.command:
-        mappings = load_schema_mappings(args.schema_file)
-        export_mappings(mappings, args.export)
+        export_mappings(lookup, args.export)
         return
 
     if not args.command:
@@ -1057,47 +1673,25 @@ def main() -> None:
 
     # Handle build-schema command separately (doesn't need existing schema)
     if args.command == "build-schema":
-        build_schema_from_pdfs(args.pdf_files, args.output, args.stats)
+        use_cache = not (args.no_cache or args.skip_cache)
+        build_schema_from_pdfs(args.pdf_files, args.output, args.stats, use_cache)
         return
 
-    # Load schema mappings from default file
-    mappings = load_schema_mappings(args.schema_file)
-    lookup = SchemaLookup(mappings)
-
-    if args.command == "lookup-guid":
-        lookup_guid(lookup, args.guid)
-    elif args.command == "lookup-name":
-        lookup_name(lookup, args.name)
-    elif args.command == "search":
-        search_pattern(lookup, args.pattern)
-    elif args.command == "list":
-        list_all(lookup)
-    elif args.command == "intersect":
-        intersect_files(lookup, args.files, args.annotate, args.output)
-    elif args.command == "annotate":
-        annotate_file(lookup, args.input_file, args.output)
-    elif args.command == "unique":
-        unique_elements(lookup, args.files, args.annotate, args.output)
-    elif args.command == "subset":
-        # Validate that at least one include option is provided
-        if not args.include and not args.include_any:
-            if _PLAIN_OUTPUT:
-                print("ERROR: Must specify at least one of --include or --include-any", file=sys.stderr)
-            else:
-                print_error("Must specify at least one of --include or --include-any")
-            sys.exit(1)
-        
-        subset_analysis(
-            lookup=lookup,
-            include_all=args.include,
-            include_any=args.include_any, 
-            exclude=args.exclude,
-            annotate=args.annotate,
-            output_file=args.output,
-            operation_name="Subset Analysis"
-        )
-    elif args.command == "export":
-        export_mappings(mappings, args.format, args.output)
+    _COMMAND_HANDLERS[args.command](args, lookup)
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    try:
+        _run_cli()
+        # Flush inside the try so a reader that already exited (e.g. head or a
+        # closed pager) is caught here rather than at interpreter shutdown
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Point stdout at devnull so the final flush at exit can't fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == "__main__":